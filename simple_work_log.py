@@ -2,93 +2,77 @@
 """
 Simple Work Log Dashboard - No external dependencies required
 Run with: python3 simple_work_log.py
+Faster under PyPy: pypy3 simple_work_log.py
 """
 
+import email.utils
+import gzip
+import hashlib
+import html
 import json
 import os
-from datetime import datetime, timedelta
+import platform
+from datetime import datetime, timedelta, timezone
 import webbrowser
 import http.server
 import socketserver
 import threading
-import time
+
+# orjson is a C extension; under PyPy the JIT-compiled stdlib json is faster
+if platform.python_implementation() == 'PyPy':
+    orjson = None
+else:
+    try:
+        import orjson
+    except ImportError:  # stdlib json works fine, just slower
+        orjson = None
 
 # Configuration
 PORT = 8080
 DATA_FILE = "work_logs.json"
-TIME_SLOTS = [
+TIME_SLOTS = (
     "2:00 PM", "3:00 PM", "4:00 PM", "5:00 PM", "6:00 PM",
     "7:00 PM", "8:00 PM", "9:00 PM", "10:00 PM", "11:00 PM", "11:30 PM"
-]
+)
+_TIME_SLOTS_SET = frozenset(TIME_SLOTS)
+# Hourly slots that start on the hour, keyed by 24-hour clock hour
+_HOUR_TO_SLOT = {hour: f"{hour - 12}:00 PM" for hour in range(14, 23)}
 
-def load_data():
-    """Load work logs from JSON file"""
-    if os.path.exists(DATA_FILE):
-        with open(DATA_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+# JSON (de)serialisation, using orjson when it is installed
+if orjson is not None:
+    def _json_loads(raw):
+        return orjson.loads(raw)
 
-def save_data(data):
-    """Save work logs to JSON file"""
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    def _json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+else:
+    def _json_loads(raw):
+        return json.loads(raw)
 
-def get_ist_time():
-    """Get current time in IST (assuming system time can be converted)"""
-    # Simple IST calculation (UTC + 5:30)
-    utc_now = datetime.utcnow()
-    ist_now = utc_now + timedelta(hours=5, minutes=30)
-    return ist_now
+    def _json_dumps(data):
+        return json.dumps(data, indent=2).encode('utf-8')
 
-def get_current_time_slot():
-    """Get current time slot"""
-    ist_time = get_ist_time()
-    hour = ist_time.hour
-    minute = ist_time.minute
-    
-    if hour < 14 or hour > 23 or (hour == 23 and minute > 30):
-        return None
-    
-    if hour == 23 and minute >= 30:
-        return "11:30 PM"
-    
-    if 14 <= hour <= 22:
-        hour_12 = hour - 12 if hour > 12 else hour
-        return f"{hour_12}:00 PM"
-    
-    return None
+# IST is a fixed UTC offset
+_IST_OFFSET = timedelta(hours=5, minutes=30)
 
-def generate_html():
-    """Generate HTML dashboard"""
-    data = load_data()
-    current_time = get_ist_time()
-    current_slot = get_current_time_slot()
-    today = current_time.strftime("%Y-%m-%d")
-    
-    # Get today's data
-    today_data = data.get(today, {'time_slots': {}, 'is_holiday': False})
-    
-    # Calculate progress
-    completed_slots = [slot for slot, desc in today_data['time_slots'].items() if desc.strip()]
-    completion_rate = (len(completed_slots) / len(TIME_SLOTS)) * 100
-    
-    html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Work Log Dashboard</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ 
+# Rendered dashboard cache, keyed on data file mtime and the displayed minute
+_HTML_CACHE = {'key': None, 'bytes': b'', 'gzip': None}
+_HTML_CACHE_LOCK = threading.Lock()
+
+# Parsed work logs, reloaded when the data file's mtime changes
+_DATA_CACHE = {'mtime': -1, 'data': None}
+
+# Static page fragments, built and encoded once at import
+_CSS = """
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { 
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: #f8fafc;
             color: #334155;
             line-height: 1.6;
-        }}
-        .container {{ max-width: 1200px; margin: 0 auto; padding: 20px; }}
-        .header {{ 
+        }
+        .container { max-width: 1200px; margin: 0 auto; padding: 20px; }
+        .header { 
             background: white; 
             padding: 20px; 
             border-radius: 10px; 
@@ -97,70 +81,70 @@ def generate_html():
             display: flex;
             justify-content: space-between;
             align-items: center;
-        }}
-        .title {{ font-size: 28px; font-weight: 700; color: #1e293b; }}
-        .subtitle {{ color: #64748b; font-size: 14px; }}
-        .time-info {{ text-align: right; }}
-        .current-time {{ font-size: 18px; font-weight: 600; color: #3b82f6; }}
-        .current-slot {{ font-size: 14px; color: #10b981; }}
+        }
+        .title { font-size: 28px; font-weight: 700; color: #1e293b; }
+        .subtitle { color: #64748b; font-size: 14px; }
+        .time-info { text-align: right; }
+        .current-time { font-size: 18px; font-weight: 600; color: #3b82f6; }
+        .current-slot { font-size: 14px; color: #10b981; }
         
-        .stats {{ 
+        .stats { 
             display: grid; 
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); 
             gap: 20px; 
             margin-bottom: 20px; 
-        }}
-        .stat-card {{ 
+        }
+        .stat-card { 
             background: white; 
             padding: 20px; 
             border-radius: 10px; 
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .stat-title {{ font-size: 14px; color: #64748b; margin-bottom: 5px; }}
-        .stat-value {{ font-size: 24px; font-weight: 700; color: #1e293b; }}
+        }
+        .stat-title { font-size: 14px; color: #64748b; margin-bottom: 5px; }
+        .stat-value { font-size: 24px; font-weight: 700; color: #1e293b; }
         
-        .progress-bar {{ 
+        .progress-bar { 
             width: 100%; 
             height: 10px; 
             background: #e2e8f0; 
             border-radius: 5px; 
             margin-top: 10px;
-        }}
-        .progress-fill {{ 
+        }
+        .progress-fill { 
             height: 100%; 
             background: linear-gradient(90deg, #3b82f6, #10b981); 
             border-radius: 5px; 
             transition: width 0.3s ease;
-        }}
+        }
         
-        .time-slots {{ 
+        .time-slots { 
             display: grid; 
             grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); 
             gap: 20px; 
-        }}
-        .time-slot {{ 
+        }
+        .time-slot { 
             background: white; 
             padding: 20px; 
             border-radius: 10px; 
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             transition: transform 0.2s ease;
-        }}
-        .time-slot:hover {{ transform: translateY(-2px); }}
-        .time-slot.current {{ border-left: 4px solid #3b82f6; background: #eff6ff; }}
-        .time-slot.completed {{ border-left: 4px solid #10b981; }}
-        .slot-header {{ 
+        }
+        .time-slot:hover { transform: translateY(-2px); }
+        .time-slot.current { border-left: 4px solid #3b82f6; background: #eff6ff; }
+        .time-slot.completed { border-left: 4px solid #10b981; }
+        .slot-header { 
             display: flex; 
             justify-content: space-between; 
             align-items: center; 
             margin-bottom: 15px; 
-        }}
-        .slot-time {{ font-size: 16px; font-weight: 600; }}
-        .slot-status {{ font-size: 20px; }}
-        .completed {{ color: #10b981; }}
-        .current-indicator {{ color: #3b82f6; }}
-        .pending {{ color: #94a3b8; }}
+        }
+        .slot-time { font-size: 16px; font-weight: 600; }
+        .slot-status { font-size: 20px; }
+        .completed { color: #10b981; }
+        .current-indicator { color: #3b82f6; }
+        .pending { color: #94a3b8; }
         
-        textarea {{ 
+        textarea { 
             width: 100%; 
             min-height: 80px; 
             padding: 10px; 
@@ -168,14 +152,14 @@ def generate_html():
             border-radius: 5px; 
             font-family: inherit;
             resize: vertical;
-        }}
-        textarea:focus {{ 
+        }
+        textarea:focus { 
             outline: none; 
             border-color: #3b82f6; 
             box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1); 
-        }}
+        }
         
-        .holiday-banner {{ 
+        .holiday-banner { 
             background: #fef3c7; 
             color: #92400e; 
             padding: 15px; 
@@ -183,9 +167,9 @@ def generate_html():
             text-align: center; 
             margin-bottom: 20px; 
             font-weight: 600;
-        }}
+        }
         
-        .refresh-btn {{ 
+        .refresh-btn { 
             background: #3b82f6; 
             color: white; 
             border: none; 
@@ -193,14 +177,29 @@ def generate_html():
             border-radius: 5px; 
             cursor: pointer; 
             font-size: 14px;
-        }}
-        .refresh-btn:hover {{ background: #2563eb; }}
+        }
+        .refresh-btn:hover { background: #2563eb; }
         
-        @media (max-width: 768px) {{
-            .header {{ flex-direction: column; text-align: center; gap: 15px; }}
-            .time-info {{ text-align: center; }}
-        }}
-    </style>
+        @media (max-width: 768px) {
+            .header { flex-direction: column; text-align: center; gap: 15px; }
+            .time-info { text-align: center; }
+        }
+"""
+
+# Stylesheet served separately so dashboard polls only carry the HTML
+_CSS_BYTES = _CSS.encode('utf-8')
+_CSS_GZIP = gzip.compress(_CSS_BYTES, compresslevel=9, mtime=0)
+# Content hash in the stylesheet URL, so edits to _CSS bypass the immutable cache
+_CSS_VERSION = hashlib.sha1(_CSS_BYTES).hexdigest()[:8]
+
+_HEAD_BYTES = ("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Work Log Dashboard</title>
+    <link rel="stylesheet" href="/static/style.css?v=""" + _CSS_VERSION + """">
 </head>
 <body>
     <div class="container">
@@ -210,7 +209,117 @@ def generate_html():
                 <div class="subtitle">Track your productivity from 2 PM to 11:30 PM IST</div>
             </div>
             <div class="time-info">
-                <div class="current-time">{current_time.strftime("%I:%M %p")} IST</div>
+""").encode('utf-8')
+
+_MID_BYTES = b"""
+        <div class="time-slots">
+"""
+
+_TAIL_BYTES = b"""
+        </div>
+    </div>
+    
+    <script>
+        function saveWork(textarea) {
+            const slot = textarea.getAttribute('data-slot');
+            const description = textarea.value;
+            
+            // Save to localStorage as backup
+            const today = new Date().toISOString().split('T')[0];
+            let data = JSON.parse(localStorage.getItem('workLogs') || '{}');
+            
+            if (!data[today]) {
+                data[today] = {time_slots: {}, is_holiday: false};
+            }
+            data[today].time_slots[slot] = description;
+            
+            localStorage.setItem('workLogs', JSON.stringify(data));
+            
+            // You can add server-side saving here if needed
+            console.log('Saved work for', slot, ':', description);
+        }
+        
+        // Auto-refresh every 5 minutes
+        setTimeout(() => location.reload(), 300000);
+    </script>
+</body>
+</html>
+"""
+
+_SLOT_TMPL = b"""
+            <div class="time-slot %s">
+                <div class="slot-header">
+                    <div class="slot-time">%s</div>
+                    <div class="slot-status">%s</div>
+                </div>
+                <textarea 
+                    placeholder="What did you work on during this hour?"
+                    data-slot="%s"
+                    onchange="saveWork(this)"
+                >%s</textarea>
+            </div>
+"""
+
+_SLOT_BYTES = {slot: slot.encode('utf-8') for slot in TIME_SLOTS}
+_STATUS_CURRENT = (b"current", "🔥".encode('utf-8'))
+_STATUS_COMPLETED = (b"completed", "✅".encode('utf-8'))
+_STATUS_PENDING = (b"", "⏰".encode('utf-8'))
+
+def load_data():
+    """Load work logs from JSON file, re-parsing only when it has changed"""
+    mtime = os.stat(DATA_FILE).st_mtime_ns if os.path.exists(DATA_FILE) else 0
+    if _DATA_CACHE['mtime'] != mtime:
+        if mtime:
+            with open(DATA_FILE, 'rb') as f:
+                _DATA_CACHE['data'] = _json_loads(f.read())
+        else:
+            _DATA_CACHE['data'] = {}
+        _DATA_CACHE['mtime'] = mtime
+    return _DATA_CACHE['data']
+
+def save_data(data):
+    """Save work logs to JSON file"""
+    with open(DATA_FILE, 'wb') as f:
+        f.write(_json_dumps(data))
+
+def get_ist_time():
+    """Get current time in IST (assuming system time can be converted)"""
+    # Simple IST calculation (UTC + 5:30)
+    return datetime.utcnow() + _IST_OFFSET
+
+def _slot_for(hour, minute):
+    """Map an IST hour and minute to its time slot"""
+    if hour == 23 and minute == 30:
+        return "11:30 PM"
+    
+    return _HOUR_TO_SLOT.get(hour)
+
+# Slot for every minute of the day, indexed by hour * 60 + minute
+_SLOT_BY_MINUTE = tuple(_slot_for(m // 60, m % 60) for m in range(24 * 60))
+
+def get_current_time_slot(ist_time=None):
+    """Get current time slot"""
+    if ist_time is None:
+        ist_time = get_ist_time()
+    return _SLOT_BY_MINUTE[ist_time.hour * 60 + ist_time.minute]
+
+def generate_html(current_time=None):
+    """Generate HTML dashboard as UTF-8 bytes"""
+    data = load_data()
+    if current_time is None:
+        current_time = get_ist_time()
+    current_slot = get_current_time_slot(current_time)
+    today = current_time.strftime("%Y-%m-%d")
+    
+    # Get today's data
+    today_data = data.get(today, {'time_slots': {}, 'is_holiday': False})
+    time_slots = today_data['time_slots']
+    
+    # Calculate progress
+    completed_slots = [slot for slot, desc in time_slots.items() if slot in _TIME_SLOTS_SET and desc.strip()]
+    completion_rate = (len(completed_slots) / len(TIME_SLOTS)) * 100
+    
+    header = f"""                <div class="current-time">{current_time.strftime("%I:%M %p")} IST</div>
                 <div class="current-slot">
                     {"🔥 Current: " + current_slot if current_slot else "🌙 Outside work hours"}
                 </div>
@@ -237,84 +346,132 @@ def generate_html():
                 <div class="stat-value">{current_time.strftime("%b %d")}</div>
             </div>
         </div>
-        
-        <div class="time-slots">
-    """
+        """
     
     # Generate time slot cards
+    cards = []
+    append = cards.append
     for slot in TIME_SLOTS:
-        description = today_data['time_slots'].get(slot, '')
-        is_current = slot == current_slot
-        is_completed = bool(description.strip())
-        
-        status_icon = "🔥" if is_current else "✅" if is_completed else "⏰"
-        status_class = "current" if is_current else "completed" if is_completed else ""
+        description = time_slots.get(slot, '')
+        if slot == current_slot:
+            status_class, status_icon = _STATUS_CURRENT
+        elif description.strip():
+            status_class, status_icon = _STATUS_COMPLETED
+        else:
+            status_class, status_icon = _STATUS_PENDING
         
-        html += f"""
-            <div class="time-slot {status_class}">
-                <div class="slot-header">
-                    <div class="slot-time">{slot}</div>
-                    <div class="slot-status">{status_icon}</div>
-                </div>
-                <textarea 
-                    placeholder="What did you work on during this hour?"
-                    data-slot="{slot}"
-                    onchange="saveWork(this)"
-                >{description}</textarea>
-            </div>
-        """
+        slot_bytes = _SLOT_BYTES[slot]
+        append(_SLOT_TMPL % (
+            status_class, slot_bytes, status_icon, slot_bytes,
+            html.escape(description).encode('utf-8'),
+        ))
     
-    html += """
-        </div>
-    </div>
-    
-    <script>
-        function saveWork(textarea) {
-            const slot = textarea.getAttribute('data-slot');
-            const description = textarea.value;
-            
-            // Save to localStorage as backup
-            const today = new Date().toISOString().split('T')[0];
-            let data = JSON.parse(localStorage.getItem('workLogs') || '{}');
-            
-            if (!data[today]) {
-                data[today] = {time_slots: {}, is_holiday: false};
-            }
-            data[today].time_slots[slot] = description;
-            
-            localStorage.setItem('workLogs', JSON.stringify(data));
-            
-            // You can add server-side saving here if needed
-            console.log('Saved work for', slot, ':', description);
-        }
-        
-        // Auto-refresh every 5 minutes
-        setTimeout(() => location.reload(), 300000);
-    </script>
-</body>
-</html>
-    """
+    return b"".join([
+        _HEAD_BYTES, header.encode('utf-8'), _MID_BYTES, *cards, _TAIL_BYTES,
+    ])
+
+def get_dashboard_state():
+    """Return the current time, dashboard cache key and Last-Modified timestamp"""
+    current_time = get_ist_time()
+    mtime = os.stat(DATA_FILE).st_mtime_ns if os.path.exists(DATA_FILE) else 0
+    # The page shows the clock to the minute, which also fixes the date and slot
+    key = (mtime, current_time.strftime("%Y-%m-%d %H:%M"))
     
-    return html
+    # The page changes when the data file does and when the displayed minute ticks over
+    minute_start = (current_time - _IST_OFFSET).replace(
+        second=0, microsecond=0, tzinfo=timezone.utc
+    ).timestamp()
+    last_modified = max(mtime // 1_000_000_000, int(minute_start))
+    return current_time, key, last_modified
+
+def get_dashboard_bytes(current_time, key, gzipped=False):
+    """Return the encoded dashboard, re-rendering only when its inputs change"""
+    with _HTML_CACHE_LOCK:
+        if _HTML_CACHE['key'] != key:
+            _HTML_CACHE['bytes'] = generate_html(current_time)
+            _HTML_CACHE['gzip'] = None
+            _HTML_CACHE['key'] = key
+        if not gzipped:
+            return _HTML_CACHE['bytes']
+        if _HTML_CACHE['gzip'] is None:
+            _HTML_CACHE['gzip'] = gzip.compress(_HTML_CACHE['bytes'], mtime=0)
+        return _HTML_CACHE['gzip']
 
 class WorkLogHandler(http.server.SimpleHTTPRequestHandler):
+    # Set TCP_NODELAY on each connection so small responses are not held back
+    disable_nagle_algorithm = True
+    
+    def accepts_gzip(self):
+        """Check whether the client advertised gzip support"""
+        return 'gzip' in self.headers.get('Accept-Encoding', '')
+    
+    def not_modified_since(self, last_modified):
+        """Check the request's If-Modified-Since against a POSIX timestamp"""
+        header = self.headers.get('If-Modified-Since')
+        if not header:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(header)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # A date later than now is invalid (RFC 2616 14.25) and must not pin a 304
+        if since > datetime.now(timezone.utc):
+            return False
+        return since.timestamp() >= last_modified
+    
+    def send_cache_headers(self, cache_control, last_modified=None):
+        """Send the caching headers shared by 200 and 304 responses"""
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Cache-Control', cache_control)
+        if last_modified is not None:
+            self.send_header('Last-Modified', email.utils.formatdate(last_modified, usegmt=True))
+    
+    def send_body(self, body, content_type, cache_control, gzipped, last_modified=None):
+        """Send a 200 response with the given, possibly gzipped, body"""
+        self.send_response(200)
+        self.send_header('Content-type', content_type)
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_cache_headers(cache_control, last_modified)
+        self.end_headers()
+        self.wfile.write(body)
+    
     def do_GET(self):
-        if self.path == '/' or self.path == '/index.html':
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            html = generate_html()
-            self.wfile.write(html.encode())
+        gzipped = self.accepts_gzip()
+        path = self.path.split('?', 1)[0]
+        if path == '/' or path == '/index.html':
+            current_time, key, last_modified = get_dashboard_state()
+            if self.not_modified_since(last_modified):
+                self.send_response(304)
+                self.send_cache_headers('no-cache', last_modified)
+                self.end_headers()
+                return
+            body = get_dashboard_bytes(current_time, key, gzipped)
+            self.send_body(body, 'text/html; charset=utf-8', 'no-cache', gzipped, last_modified)
+        elif path == '/static/style.css':
+            body = _CSS_GZIP if gzipped else _CSS_BYTES
+            self.send_body(body, 'text/css; charset=utf-8',
+                           'public, max-age=31536000, immutable', gzipped)
         else:
             super().do_GET()
 
+class ThreadedServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    """HTTP server handling each request on its own daemon thread"""
+    daemon_threads = True
+    allow_reuse_address = True
+
 def start_server():
     """Start the local web server"""
     try:
-        with socketserver.TCPServer(("", PORT), WorkLogHandler) as httpd:
+        with ThreadedServer(("", PORT), WorkLogHandler) as httpd:
             print(f"🚀 Work Log Dashboard running at: http://localhost:{PORT}")
             print(f"📁 Data will be saved to: {os.path.abspath(DATA_FILE)}")
             print("⏹️  Press Ctrl+C to stop the server")
+            if platform.python_implementation() == 'CPython':
+                print("💡 Tip: this server is pure Python and runs faster under PyPy (pypy3 simple_work_log.py)")
             httpd.serve_forever()
     except KeyboardInterrupt:
         print("\\n👋 Server stopped. Your work logs are saved!")
@@ -324,32 +481,27 @@ def start_server():
         else:
             print(f"❌ Error starting server: {e}")
 
-def main():
-    """Main function"""
-    print("🕐 Work Log Dashboard - Simple Version")
-    print("=" * 50)
-    
-    # Start server in a separate thread
-    server_thread = threading.Thread(target=start_server, daemon=True)
-    server_thread.start()
-    
-    # Give server time to start
-    time.sleep(2)
-    
-    # Open browser
+def open_browser():
+    """Open the dashboard in the default browser"""
     try:
         webbrowser.open(f'http://localhost:{PORT}')
         print(f"🌐 Opening browser at http://localhost:{PORT}")
     except Exception as e:
         print(f"⚠️  Could not open browser automatically: {e}")
         print(f"📱 Manually open: http://localhost:{PORT}")
+
+def main():
+    """Main function"""
+    print("🕐 Work Log Dashboard - Simple Version")
+    print("=" * 50)
     
-    # Keep main thread alive
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        print("\\n👋 Shutting down...")
+    # Open the browser shortly after the server starts listening
+    browser_timer = threading.Timer(1.0, open_browser)
+    browser_timer.daemon = True
+    browser_timer.start()
+    
+    # Serve on the main thread; Ctrl+C is handled inside start_server
+    start_server()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,13 +1,17 @@
 import streamlit as st
-import pandas as pd
 import json
 import os
+from collections import Counter, defaultdict
 from datetime import datetime, time, timedelta
-import pytz
 from pathlib import Path
-import plotly.express as px
+from zoneinfo import ZoneInfo
 import plotly.graph_objects as go
 
+try:
+    import orjson
+except ImportError:  # stdlib json works fine, just slower
+    orjson = None
+
 # Configure page
 st.set_page_config(
     page_title="Work Log Dashboard",
@@ -17,52 +21,92 @@ st.set_page_config(
 )
 
 # Time slots from 2 PM to 11:30 PM IST
-TIME_SLOTS = [
+TIME_SLOTS = (
     "2:00 PM", "3:00 PM", "4:00 PM", "5:00 PM", "6:00 PM",
     "7:00 PM", "8:00 PM", "9:00 PM", "10:00 PM", "11:00 PM", "11:30 PM"
-]
+)
+_TIME_SLOTS_SET = frozenset(TIME_SLOTS)
+# Hourly slots that start on the hour, keyed by 24-hour clock hour
+_HOUR_TO_SLOT = {hour: f"{hour - 12}:00 PM" for hour in range(14, 23)}
 
 # Data file path
 DATA_FILE = Path("work_logs.json")
 
+# JSON (de)serialisation, using orjson when it is installed
+if orjson is not None:
+    def _json_loads(raw):
+        return orjson.loads(raw)
+
+    def _json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+else:
+    def _json_loads(raw):
+        return json.loads(raw)
+
+    def _json_dumps(data):
+        return json.dumps(data, indent=2).encode('utf-8')
+
+# IST timezone, constructed once
+_IST = ZoneInfo('Asia/Kolkata')
+
+def _classify(description):
+    """Return the work area a description belongs to"""
+    desc_lower = description.lower()
+    if 'frontend' in desc_lower or 'react' in desc_lower or 'ui' in desc_lower:
+        return 'Frontend'
+    elif 'backend' in desc_lower or 'api' in desc_lower or 'server' in desc_lower:
+        return 'Backend'
+    elif 'meeting' in desc_lower or 'standup' in desc_lower:
+        return 'Meetings'
+    elif 'review' in desc_lower:
+        return 'Code Review'
+    elif 'documentation' in desc_lower or 'docs' in desc_lower:
+        return 'Documentation'
+    return 'Other'
+
+def data_mtime():
+    """Return the data file's mtime in nanoseconds, or 0 if it does not exist"""
+    return DATA_FILE.stat().st_mtime_ns if DATA_FILE.exists() else 0
+
+@st.cache_data(max_entries=2)
+def _load_cached(mtime):
+    """Parse the data file, once per mtime"""
+    if mtime:
+        return _json_loads(DATA_FILE.read_bytes())
+    return {}
+
 def load_data():
     """Load work logs from JSON file"""
-    if DATA_FILE.exists():
-        with open(DATA_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    return _load_cached(data_mtime())
 
 def save_data(data):
     """Save work logs to JSON file"""
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    DATA_FILE.write_bytes(_json_dumps(data))
 
 def get_ist_time():
     """Get current time in IST"""
-    ist = pytz.timezone('Asia/Kolkata')
-    return datetime.now(ist)
+    return datetime.now(_IST)
 
-def get_current_time_slot():
-    """Get current time slot based on IST time"""
-    current_time = get_ist_time()
-    hour = current_time.hour
-    minute = current_time.minute
-    
-    if hour < 14 or hour > 23 or (hour == 23 and minute > 30):
-        return None
-    
-    if hour == 23 and minute >= 30:
+def _slot_for(hour, minute):
+    """Map an IST hour and minute to its time slot"""
+    if hour == 23 and minute == 30:
         return "11:30 PM"
     
-    if hour >= 14 and hour <= 22:
-        hour_12 = hour - 12 if hour > 12 else hour
-        return f"{hour_12}:00 PM"
-    
-    return None
+    return _HOUR_TO_SLOT.get(hour)
+
+# Slot for every minute of the day, indexed by hour * 60 + minute
+_SLOT_BY_MINUTE = tuple(_slot_for(m // 60, m % 60) for m in range(24 * 60))
 
-def is_work_hours():
+def get_current_time_slot(current_time=None):
+    """Get current time slot based on IST time"""
+    if current_time is None:
+        current_time = get_ist_time()
+    return _SLOT_BY_MINUTE[current_time.hour * 60 + current_time.minute]
+
+def is_work_hours(current_time=None):
     """Check if current time is within work hours"""
-    current_time = get_ist_time()
+    if current_time is None:
+        current_time = get_ist_time()
     hour = current_time.hour
     minute = current_time.minute
     return (hour >= 14 and hour < 23) or (hour == 23 and minute <= 30)
@@ -71,13 +115,20 @@ def get_date_string(date_obj):
     """Convert date to string format"""
     return date_obj.strftime("%Y-%m-%d")
 
-def calculate_monthly_summary(data, year, month):
-    """Calculate monthly statistics"""
+# Cached on data_hash (the data file's mtime) instead of hashing the whole
+# history; the underscore keeps Streamlit from hashing _data
+@st.cache_data(max_entries=2)
+def calculate_monthly_summary(_data, data_hash, year, month):
+    """Calculate monthly statistics and per-day work areas in a single pass"""
+    data = _data
     month_key = f"{year}-{month:02d}"
     total_days = set()
     holiday_days = set()
     productive_hours = 0
-    work_areas = {}
+    work_areas = Counter()
+    per_day_areas = defaultdict(Counter)
+    # Local alias keeps the global lookup out of the inner loop
+    classify = _classify
     
     for date_key, date_data in data.items():
         if date_key.startswith(month_key):
@@ -87,24 +138,16 @@ def calculate_monthly_summary(data, year, month):
                 holiday_days.add(date_key)
                 continue
             
+            day_areas = per_day_areas[date_key]
             for slot, description in date_data.get('time_slots', {}).items():
-                if description.strip():
+                # Same definition of a completed slot as the daily summary
+                if slot in _TIME_SLOTS_SET and description.strip():
                     productive_hours += 1 if slot != "11:30 PM" else 0.5
                     
                     # Categorize work areas
-                    desc_lower = description.lower()
-                    if 'frontend' in desc_lower or 'react' in desc_lower or 'ui' in desc_lower:
-                        work_areas['Frontend'] = work_areas.get('Frontend', 0) + 1
-                    elif 'backend' in desc_lower or 'api' in desc_lower or 'server' in desc_lower:
-                        work_areas['Backend'] = work_areas.get('Backend', 0) + 1
-                    elif 'meeting' in desc_lower or 'standup' in desc_lower:
-                        work_areas['Meetings'] = work_areas.get('Meetings', 0) + 1
-                    elif 'review' in desc_lower:
-                        work_areas['Code Review'] = work_areas.get('Code Review', 0) + 1
-                    elif 'documentation' in desc_lower or 'docs' in desc_lower:
-                        work_areas['Documentation'] = work_areas.get('Documentation', 0) + 1
-                    else:
-                        work_areas['Other'] = work_areas.get('Other', 0) + 1
+                    area = classify(description)
+                    work_areas[area] += 1
+                    day_areas[area] += 1
     
     working_days = len(total_days) - len(holiday_days)
     avg_hours = productive_hours / working_days if working_days > 0 else 0
@@ -115,13 +158,21 @@ def calculate_monthly_summary(data, year, month):
         'working_days': working_days,
         'productive_hours': productive_hours,
         'avg_hours_per_day': round(avg_hours, 1),
-        'work_areas': work_areas
+        'work_areas': work_areas,
+        'per_day_areas': per_day_areas
     }
 
 # Main app
 def main():
     # Load data
     data = load_data()
+    dirty = False
+    
+    # Resolve the clock once per rerun and share it with the helpers
+    current_time = get_ist_time()
+    current_slot = get_current_time_slot(current_time)
+    work_hours = is_work_hours(current_time)
+    today = datetime.now().date()
     
     # Header
     col1, col2, col3 = st.columns([2, 1, 1])
@@ -130,14 +181,12 @@ def main():
         st.markdown("Track your daily productivity from 2 PM to 11:30 PM IST")
     
     with col2:
-        current_time = get_ist_time()
         st.metric("Current Time (IST)", current_time.strftime("%I:%M %p"))
         
     with col3:
-        current_slot = get_current_time_slot()
-        if current_slot and is_work_hours():
+        if current_slot and work_hours:
             st.success(f"⏰ Current Slot: {current_slot}")
-        elif is_work_hours():
+        elif work_hours:
             st.info("🔄 Work Hours Active")
         else:
             st.info("🌙 Outside Work Hours")
@@ -149,7 +198,7 @@ def main():
         # Date selection
         selected_date = st.date_input(
             "Select Date",
-            value=datetime.now().date(),
+            value=today,
             help="Choose the date to view/edit work logs"
         )
         
@@ -165,27 +214,16 @@ def main():
         # Update holiday status
         if date_key not in data:
             data[date_key] = {'time_slots': {}, 'is_holiday': False}
-        data[date_key]['is_holiday'] = is_holiday
-        save_data(data)
+            dirty = True
+        if data[date_key]['is_holiday'] != is_holiday:
+            data[date_key]['is_holiday'] = is_holiday
+            dirty = True
         
         st.divider()
         
-        # Monthly summary
+        # Monthly summary, filled in below once this rerun's edits are recorded
         st.subheader("📊 Monthly Summary")
-        current_month = datetime.now().month
-        current_year = datetime.now().year
-        
-        summary = calculate_monthly_summary(data, current_year, current_month)
-        
-        st.metric("Productive Hours", f"{summary['productive_hours']:.1f}")
-        st.metric("Working Days", f"{summary['working_days']}/{summary['total_days']}")
-        st.metric("Avg Hours/Day", summary['avg_hours_per_day'])
-        
-        if summary['work_areas']:
-            st.subheader("Top Work Areas")
-            for area, hours in sorted(summary['work_areas'].items(), key=lambda x: x[1], reverse=True)[:3]:
-                percentage = (hours / sum(summary['work_areas'].values())) * 100
-                st.write(f"**{area}**: {percentage:.0f}%")
+        summary_container = st.container()
     
     # Main content
     if is_holiday:
@@ -202,6 +240,7 @@ def main():
         # Create columns for time slots
         cols_per_row = 2
         slot_chunks = [TIME_SLOTS[i:i + cols_per_row] for i in range(0, len(TIME_SLOTS), cols_per_row)]
+        is_today = date_key == get_date_string(today)
         
         for chunk in slot_chunks:
             cols = st.columns(len(chunk))
@@ -209,11 +248,7 @@ def main():
             for idx, time_slot in enumerate(chunk):
                 with cols[idx]:
                     # Check if this is the current time slot
-                    is_current = (
-                        current_slot == time_slot and 
-                        is_work_hours() and 
-                        date_key == get_date_string(datetime.now().date())
-                    )
+                    is_current = current_slot == time_slot and work_hours and is_today
                     
                     # Get existing description
                     existing_description = data[date_key]['time_slots'].get(time_slot, '')
@@ -237,16 +272,39 @@ def main():
                         label_visibility="collapsed"
                     )
                     
-                    # Save description
-                    data[date_key]['time_slots'][time_slot] = description
-                    save_data(data)
+                    # Record description; saved once after all slots render
+                    if data[date_key]['time_slots'].get(time_slot) != description:
+                        data[date_key]['time_slots'][time_slot] = description
+                        dirty = True
+    
+    # Save before summarising so the summary cache key reflects this rerun's edits
+    if dirty:
+        save_data(data)
+    
+    # One pass over the month feeds both the sidebar and the daily work areas
+    current_month = today.month
+    current_year = today.year
+    summary = calculate_monthly_summary(data, data_mtime(), current_year, current_month)
+    
+    with summary_container:
+        st.metric("Productive Hours", f"{summary['productive_hours']:.1f}")
+        st.metric("Working Days", f"{summary['working_days']}/{summary['total_days']}")
+        st.metric("Avg Hours/Day", summary['avg_hours_per_day'])
         
+        if summary['work_areas']:
+            st.subheader("Top Work Areas")
+            total_areas = sum(summary['work_areas'].values())
+            for area, hours in summary['work_areas'].most_common(3):
+                percentage = (hours / total_areas) * 100
+                st.write(f"**{area}**: {percentage:.0f}%")
+    
+    if not is_holiday:
         # Daily summary
         st.divider()
         st.subheader("📈 Daily Summary")
         
         daily_slots = data[date_key]['time_slots']
-        completed_slots = [slot for slot, desc in daily_slots.items() if desc.strip()]
+        completed_slots = [slot for slot, desc in daily_slots.items() if slot in _TIME_SLOTS_SET and desc.strip()]
         total_slots = len(TIME_SLOTS)
         completion_rate = (len(completed_slots) / total_slots) * 100
         
@@ -266,21 +324,10 @@ def main():
         # Work areas for the day
         if completed_slots:
             st.subheader("🏷️ Work Areas Covered Today")
-            day_areas = {}
-            for slot in completed_slots:
-                desc = daily_slots[slot].lower()
-                if 'frontend' in desc or 'react' in desc:
-                    day_areas['Frontend'] = day_areas.get('Frontend', 0) + 1
-                elif 'backend' in desc or 'api' in desc:
-                    day_areas['Backend'] = day_areas.get('Backend', 0) + 1
-                elif 'meeting' in desc:
-                    day_areas['Meetings'] = day_areas.get('Meetings', 0) + 1
-                elif 'review' in desc:
-                    day_areas['Code Review'] = day_areas.get('Code Review', 0) + 1
-                elif 'documentation' in desc:
-                    day_areas['Documentation'] = day_areas.get('Documentation', 0) + 1
-                else:
-                    day_areas['Other'] = day_areas.get('Other', 0) + 1
+            day_areas = summary['per_day_areas'].get(date_key)
+            if day_areas is None:
+                # Selected date is outside the summarised month
+                day_areas = Counter(_classify(daily_slots[slot]) for slot in completed_slots)
             
             # Display work areas as badges
             area_cols = st.columns(len(day_areas))
@@ -292,23 +339,24 @@ def main():
         if len(completed_slots) > 0:
             st.subheader("📊 Hourly Productivity Visualization")
             
-            # Create hourly chart
-            chart_data = []
-            for slot in TIME_SLOTS:
-                status = "Completed" if slot in completed_slots else "Pending"
-                chart_data.append({"Time Slot": slot, "Status": status, "Value": 1})
-            
-            df = pd.DataFrame(chart_data)
+            # Create hourly chart from plain per-status arrays (no DataFrame)
+            completed_set = set(completed_slots)
+            done = [s for s in TIME_SLOTS if s in completed_set]
+            pending = [s for s in TIME_SLOTS if s not in completed_set]
             
-            fig = px.bar(
-                df, 
-                x="Time Slot", 
-                y="Value",
-                color="Status",
+            fig = go.Figure([
+                go.Bar(name="Completed", x=done, y=[1] * len(done), marker_color="#10b981"),
+                go.Bar(name="Pending", x=pending, y=[1] * len(pending), marker_color="#e5e7eb"),
+            ])
+            fig.update_layout(
                 title="Daily Work Log Status",
-                color_discrete_map={"Completed": "#10b981", "Pending": "#e5e7eb"}
+                barmode="relative",
+                xaxis={"title": "Time Slot", "categoryorder": "array", "categoryarray": list(TIME_SLOTS)},
+                yaxis_title="Value",
+                legend_title_text="Status",
+                showlegend=True,
+                height=400
             )
-            fig.update_layout(showlegend=True, height=400)
             st.plotly_chart(fig, use_container_width=True)
 
     # Footer